@@ -68,8 +68,10 @@ if __name__=="__main__":
         return None
 
 
-    # Iterate over files, and create list of modules
-    for arg in sys.argv[1:]:
+    # Iterate over files, and create list of modules. Without arguments, read
+    # one file name per line from stdin.
+    paths = sys.argv[1:] if len(sys.argv) > 1 else (line.rstrip("\n") for line in sys.stdin)
+    for arg in paths:
         handle_module(arg)
 
     def build_list_direct(arg):
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 The Orin Core developers
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or http://www.opensource.org/licenses/mit-license.php.
+'''
+Test script for circular-dependencies.py
+'''
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'circular-dependencies.py')
+
+# a.h and b.h include each other; b.cpp pulls in c.h, which is not part of a cycle.
+SOURCES = {
+    'a.h': '#include <b.h>\n',
+    'b.h': '#include <a.h>\n',
+    'b.cpp': '#include <c.h>\n',
+    'c.h': '',
+}
+
+def call_circular_dependencies(cwd, files, use_stdin):
+    if use_stdin:
+        p = subprocess.run([sys.executable, SCRIPT], input=''.join(f + '\n' for f in files), cwd=cwd,
+                           stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    else:
+        p = subprocess.run([sys.executable, SCRIPT, *files], cwd=cwd,
+                           stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    return (p.returncode, p.stdout, p.stderr)
+
+class TestCircularDependencies(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        for name, contents in SOURCES.items():
+            with open(os.path.join(self.tmpdir.name, name), 'w', encoding="utf8") as f:
+                f.write(contents)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_argv(self):
+        self.assertEqual(call_circular_dependencies(self.tmpdir.name, sorted(SOURCES), use_stdin=False),
+            (1, 'Circular dependency: a -> b -> a\n', ''))
+        self.assertEqual(call_circular_dependencies(self.tmpdir.name, ['b.cpp', 'c.h'], use_stdin=False),
+            (0, '', ''))
+
+    def test_stdin(self):
+        self.assertEqual(call_circular_dependencies(self.tmpdir.name, sorted(SOURCES), use_stdin=True),
+            (1, 'Circular dependency: a -> b -> a\n', ''))
+        self.assertEqual(call_circular_dependencies(self.tmpdir.name, ['b.cpp', 'c.h'], use_stdin=True),
+            (0, '', ''))
+
+    def test_stdin_missing_file(self):
+        # A file that cannot be read makes the analyzer fail on stderr rather
+        # than report a partial set of cycles.
+        returncode, _, stderr = call_circular_dependencies(self.tmpdir.name, ['a.h', 'missing.h'], use_stdin=True)
+        self.assertNotEqual(returncode, 0)
+        self.assertIn('missing.h', stderr)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,24 +6,176 @@ Example:
   python3 contrib/genesis/find_genesis.py \
     --timestamp "Orin 13/Nov/2025 Rebooting the chain for privacy-first payments" \
     --pubkey 042b55887b34dfaca197bd9e2e965f56086979daf2ebc2a9c85fa72ba83d34e916e6b5e6c58c82becc828e7bb2a45a005b47f80969bd77094ff826a9000cc72c55
+
+The nonce search runs considerably faster with the optional native scanner,
+which is picked up automatically once built next to this script:
+  cc -O2 -shared -fPIC -o contrib/genesis/orin_miner.so contrib/genesis/orin_miner.c
+Without a C toolchain, installing numba (and numpy) JIT-compiles an equivalent
+pure-Python SHA-256 kernel instead. With cupy and a CUDA GPU, --backend cuda
+runs the search on the GPU.
 """
 
 from __future__ import annotations
 
 import argparse
+import array
+import ctypes
 import hashlib
+import multiprocessing
+import os
+import queue
 import struct
+import threading
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
 
 COIN = 100_000_000
 
+NATIVE_LIBRARY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "orin_miner.so")
+PYTHON_CHUNK_SIZE = 1 << 16
+NATIVE_CHUNK_SIZE = 1 << 20
+CUDA_BATCH_SIZE = 1 << 24
+CUDA_BLOCK_SIZE = 256
+
+SHA256_IV = (
+    0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A, 0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19,
+)
+
+SHA256_K = (
+    0x428A2F98, 0x71374491, 0xB5C0FBCF, 0xE9B5DBA5, 0x3956C25B, 0x59F111F1, 0x923F82A4, 0xAB1C5ED5,
+    0xD807AA98, 0x12835B01, 0x243185BE, 0x550C7DC3, 0x72BE5D74, 0x80DEB1FE, 0x9BDC06A7, 0xC19BF174,
+    0xE49B69C1, 0xEFBE4786, 0x0FC19DC6, 0x240CA1CC, 0x2DE92C6F, 0x4A7484AA, 0x5CB0A9DC, 0x76F988DA,
+    0x983E5152, 0xA831C66D, 0xB00327C8, 0xBF597FC7, 0xC6E00BF3, 0xD5A79147, 0x06CA6351, 0x14292967,
+    0x27B70A85, 0x2E1B2138, 0x4D2C6DFC, 0x53380D13, 0x650A7354, 0x766A0ABB, 0x81C2C92E, 0x92722C85,
+    0xA2BFE8A1, 0xA81A664B, 0xC24B8B70, 0xC76C51A3, 0xD192E819, 0xD6990624, 0xF40E3585, 0x106AA070,
+    0x19A4C116, 0x1E376C08, 0x2748774C, 0x34B0BCB5, 0x391C0CB3, 0x4ED8AA4A, 0x5B9CCA4F, 0x682E6FF3,
+    0x748F82EE, 0x78A5636F, 0x84C87814, 0x8CC70208, 0x90BEFFFA, 0xA4506CEB, 0xBEF9A3F7, 0xC67178F2,
+)
+
+# Double-SHA256 of the header for one nonce per thread. The midstate, the
+# header tail and the target sit in constant memory, and the fully unrolled
+# rounds keep the message schedule and working state in registers.
+CUDA_KERNEL_SOURCE = r"""
+__constant__ unsigned int midstate[8];
+__constant__ unsigned int tail[3];
+__constant__ unsigned int target[8];
+
+#define ROTR(x, n) __funnelshift_r((x), (x), (n))
+
+__device__ __forceinline__ void compress(unsigned int* s, unsigned int* w)
+{
+    const unsigned int K[64] = {
+        0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+        0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+        0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+        0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+        0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+        0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+        0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+        0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+    };
+    unsigned int a = s[0], b = s[1], c = s[2], d = s[3], e = s[4], f = s[5], g = s[6], h = s[7];
+#pragma unroll
+    for (int i = 0; i < 64; ++i) {
+        if (i >= 16) {
+            const unsigned int x = w[(i - 15) & 15], y = w[(i - 2) & 15];
+            w[i & 15] += (ROTR(x, 7) ^ ROTR(x, 18) ^ (x >> 3)) + w[(i - 7) & 15] + (ROTR(y, 17) ^ ROTR(y, 19) ^ (y >> 10));
+        }
+        const unsigned int t1 = h + (ROTR(e, 6) ^ ROTR(e, 11) ^ ROTR(e, 25)) + ((e & f) ^ (~e & g)) + K[i] + w[i & 15];
+        const unsigned int t2 = (ROTR(a, 2) ^ ROTR(a, 13) ^ ROTR(a, 22)) + ((a & b) ^ (a & c) ^ (b & c));
+        h = g;
+        g = f;
+        f = e;
+        e = d + t1;
+        d = c;
+        c = b;
+        b = a;
+        a = t1 + t2;
+    }
+    s[0] += a;
+    s[1] += b;
+    s[2] += c;
+    s[3] += d;
+    s[4] += e;
+    s[5] += f;
+    s[6] += g;
+    s[7] += h;
+}
+
+extern "C" __global__ void mine_range(unsigned int base, unsigned int count, unsigned int* found)
+{
+    const unsigned int index = blockIdx.x * blockDim.x + threadIdx.x;
+    if (index >= count) return;
+    unsigned int w[16], s[8];
+
+    w[0] = tail[0];
+    w[1] = tail[1];
+    w[2] = tail[2];
+    w[3] = __byte_perm(base + index, 0, 0x0123);
+    w[4] = 0x80000000;
+#pragma unroll
+    for (int i = 5; i < 15; ++i) w[i] = 0;
+    w[15] = 0x280;
+#pragma unroll
+    for (int i = 0; i < 8; ++i) s[i] = midstate[i];
+    compress(s, w);
+
+#pragma unroll
+    for (int i = 0; i < 8; ++i) w[i] = s[i];
+    w[8] = 0x80000000;
+#pragma unroll
+    for (int i = 9; i < 15; ++i) w[i] = 0;
+    w[15] = 0x100;
+    s[0] = 0x6a09e667;
+    s[1] = 0xbb67ae85;
+    s[2] = 0x3c6ef372;
+    s[3] = 0xa54ff53a;
+    s[4] = 0x510e527f;
+    s[5] = 0x9b05688c;
+    s[6] = 0x1f83d9ab;
+    s[7] = 0x5be0cd19;
+    compress(s, w);
+
+#pragma unroll
+    for (int i = 0; i < 8; ++i) {
+        const unsigned int word = __byte_perm(s[7 - i], 0, 0x0123);
+        if (word != target[i]) {
+            if (word < target[i]) atomicMin(found, index);
+            return;
+        }
+    }
+    atomicMin(found, index);
+}
+"""
+
+
+# On OpenSSL builds this is already the C-level _hashlib.openssl_sha256
+# constructor; binding it once skips the module attribute lookup per call.
+_sha256 = hashlib.sha256
+
+# hashlib reads any buffer, so header bytes never need copying into a fresh
+# bytes object before they are hashed.
+Buffer = Union[bytes, bytearray, memoryview]
 
-def sha256(data: bytes) -> bytes:
-    return hashlib.sha256(data).digest()
 
+def sha256(data: Buffer) -> bytes:
+    return _sha256(data).digest()
 
-def dsha256(data: bytes) -> bytes:
+
+def dsha256(data: Buffer) -> bytes:
     return sha256(sha256(data))
 
 
@@ -64,25 +216,23 @@ def encode_varint(value: int) -> bytes:
     return b"\xff" + struct.pack("<Q", value)
 
 
+# version, vin count and the null prevout (hash and index) of the coinbase input
+_COINBASE_PREFIX = struct.pack("<I", 1) + encode_varint(1) + b"\x00" * 32 + struct.pack("<I", 0xFFFFFFFF)
+# Fixed scriptSig pushes ahead of the timestamp: 486604799 (0x1d00ffff) and 4
+_PUSH_486604799 = push_data(encode_script_num(486604799))
+_PUSH_4 = push_data(encode_script_num(4))
+
+
 def build_coinbase(timestamp: bytes, pubkey: bytes, reward: int) -> Tuple[bytes, bytes]:
-    script_sig = (
-        push_data(encode_script_num(486604799)) +
-        push_data(encode_script_num(4)) +
-        push_data(timestamp)
-    )
-    tx = bytearray()
-    tx += struct.pack("<I", 1)                     # version
-    tx += encode_varint(1)                         # vin count
-    tx += b"\x00" * 32                             # prevout hash
-    tx += struct.pack("<I", 0xFFFFFFFF)            # prevout index
-    tx += encode_varint(len(script_sig)) + script_sig
-    tx += struct.pack("<I", 0xFFFFFFFF)            # sequence
-    tx += encode_varint(1)                         # vout count
-    tx += struct.pack("<Q", reward)
+    script_sig = _PUSH_486604799 + _PUSH_4 + push_data(timestamp)
     script_pubkey = push_data(pubkey) + b"\xAC"     # OP_CHECKSIG
-    tx += encode_varint(len(script_pubkey)) + script_pubkey
-    tx += struct.pack("<I", 0)                     # locktime
-    tx_bytes = bytes(tx)
+    tx_bytes = b"".join((
+        _COINBASE_PREFIX,
+        encode_varint(len(script_sig)), script_sig,
+        struct.pack("<IBQ", 0xFFFFFFFF, 1, reward),  # sequence, vout count, value
+        encode_varint(len(script_pubkey)), script_pubkey,
+        struct.pack("<I", 0),                       # locktime
+    ))
     merkle = dsha256(tx_bytes)
     return tx_bytes, merkle
 
@@ -101,27 +251,359 @@ class NetworkSpec:
     start_nonce: int = 0
 
 
-def mine_genesis(merkle: bytes, spec: NetworkSpec) -> Tuple[int, int, str]:
-    target = bits_to_target(spec.bits)
+def header_prefix(merkle: bytes) -> bytes:
+    # version || prev hash || merkle root (internal little endian). The first
+    # 64 bytes of this never change during a search: n_time, bits and the
+    # nonce all live in the second SHA-256 block of the 80-byte header, so the
+    # midstate after the first block is shared by every candidate header.
+    return struct.pack("<I", 1) + b"\x00" * 32 + merkle[::-1]
+
+
+_SHA256_K_WORDS = array.array("I", SHA256_K)
+
+
+def sha256_midstate(block: bytes) -> array.array:
+    # Plain-Python SHA-256 compression of a single 64-byte block from the IV,
+    # for the backends that cannot read a midstate back out of hashlib. The
+    # block is unpacked once up front and the rounds only touch array('I')
+    # words; the schedule is per call since thread workers run this too.
+    state = array.array("I", SHA256_IV)
+    w = array.array("I", struct.unpack(">16I", block))
+    w.extend([0] * 48)
+    k = _SHA256_K_WORDS
+    for i in range(16, 64):
+        x = w[i - 15]
+        y = w[i - 2]
+        s0 = ((x >> 7) | (x << 25)) ^ ((x >> 18) | (x << 14)) ^ (x >> 3)
+        s1 = ((y >> 17) | (y << 15)) ^ ((y >> 19) | (y << 13)) ^ (y >> 10)
+        w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & 0xFFFFFFFF
+    a, b, c, d, e, f, g, h = state
+    for i in range(64):
+        s1 = ((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^ ((e >> 25) | (e << 7))
+        t1 = h + s1 + ((e & f) ^ (~e & g)) + k[i] + w[i]
+        s0 = ((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^ ((a >> 22) | (a << 10))
+        t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+        h, g, f, e, d, c, b, a = g, f, e, (d + t1) & 0xFFFFFFFF, c, b, a, (t1 + t2) & 0xFFFFFFFF
+    for i, x in enumerate((a, b, c, d, e, f, g, h)):
+        state[i] = (state[i] + x) & 0xFFFFFFFF
+    return state
+
+
+# A window of the search space: (n_time, first nonce, nonce count)
+Window = Tuple[int, int, int]
+
+
+def nonce_chunks(spec: NetworkSpec, chunk_size: int) -> Iterator[Window]:
+    # Walk the (n_time, nonce) search space in windows of consecutive nonces,
+    # moving on to the next n_time whenever the nonce wraps around.
     n_time = spec.start_time
     nonce = spec.start_nonce
     while True:
-        header = bytearray()
-        header += struct.pack("<I", 1)      # version
-        header += b"\x00" * 32             # prev hash
-        header += merkle[::-1]             # merkle root (internal little endian)
-        header += struct.pack("<I", n_time)
-        header += struct.pack("<I", spec.bits)
-        header += struct.pack("<I", nonce)
-        hash_bytes = dsha256(bytes(header))
-        hash_int = int.from_bytes(hash_bytes[::-1], "big")
-        if hash_int <= target:
-            return n_time, nonce, hash_bytes[::-1].hex()
-        nonce = (nonce + 1) & 0xFFFFFFFF
+        count = min(chunk_size, 0x100000000 - nonce)
+        yield n_time, nonce, count
+        nonce = (nonce + count) & 0xFFFFFFFF
         if nonce == 0:
             n_time += 1
 
 
+def load_native() -> Optional[ctypes.CDLL]:
+    try:
+        lib = ctypes.CDLL(NATIVE_LIBRARY)
+    except OSError:
+        return None
+    lib.orin_sha256_midstate.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.c_char_p]
+    lib.orin_sha256_midstate.restype = None
+    lib.orin_mine_range.argtypes = [
+        ctypes.POINTER(ctypes.c_uint32),  # midstate
+        ctypes.c_char_p,                  # header tail
+        ctypes.c_uint32,                  # start nonce
+        ctypes.c_uint64,                  # nonce count
+        ctypes.c_char_p,                  # target (big endian)
+        ctypes.POINTER(ctypes.c_uint32),  # found nonce
+        ctypes.c_char_p,                  # found hash
+    ]
+    lib.orin_mine_range.restype = ctypes.c_int
+    # Detect CPU features once, before any worker thread scans a range.
+    lib.orin_miner_init.argtypes = []
+    lib.orin_miner_init.restype = None
+    lib.orin_miner_init()
+    return lib
+
+
+def mine_genesis_python(merkle: bytes, spec: NetworkSpec, windows: Iterable[Window]) -> Optional[Tuple[int, int, str]]:
+    target = bits_to_target(spec.bits).to_bytes(32, "big")
+    prefix = header_prefix(merkle)
+    midstate = _sha256(prefix[:64])
+    # Last 16 bytes of the header: merkle tail, n_time, bits and nonce. Only
+    # the nonce changes per iteration, so it is packed in place.
+    tail = bytearray(prefix[64:] + struct.pack("<III", 0, spec.bits, 0))
+    pack_nonce = struct.Struct("<I").pack_into
+    tail_time = None
+    for n_time, first_nonce, count in windows:
+        if n_time != tail_time:
+            struct.pack_into("<I", tail, 4, n_time)
+            tail_time = n_time
+        # Everything below is a fast local and the three hashlib calls make up
+        # nearly all of the per-nonce cost, so there is nothing left for a
+        # specialized (exec-generated) copy of this loop to strip out.
+        for nonce in range(first_nonce, first_nonce + count):
+            pack_nonce(tail, 12, nonce)
+            inner = midstate.copy()
+            inner.update(tail)
+            # The digest is the hash in little endian. Reversed, bytes ordering
+            # is a memcmp that compares it exactly against the big endian
+            # target, usually deciding on the first byte.
+            hash_be = _sha256(inner.digest()).digest()[::-1]
+            if hash_be <= target:
+                return n_time, nonce, hash_be.hex()
+    return None
+
+
+def _sha256_compress(state, w, k):
+    # Compress the block in w[0:16] into state. Everything is held in int64 so
+    # Numba never promotes mixed signed/unsigned arithmetic to floating point.
+    for i in range(16, 64):
+        x = w[i - 15]
+        y = w[i - 2]
+        s0 = ((x >> 7) | (x << 25)) ^ ((x >> 18) | (x << 14)) ^ (x >> 3)
+        s1 = ((y >> 17) | (y << 15)) ^ ((y >> 19) | (y << 13)) ^ (y >> 10)
+        w[i] = (w[i - 16] + (s0 & 0xFFFFFFFF) + w[i - 7] + (s1 & 0xFFFFFFFF)) & 0xFFFFFFFF
+    a, b, c, d, e, f, g, h = state[0], state[1], state[2], state[3], state[4], state[5], state[6], state[7]
+    for i in range(64):
+        s1 = (((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^ ((e >> 25) | (e << 7))) & 0xFFFFFFFF
+        ch = (e & f) ^ (~e & g)
+        t1 = (h + s1 + ch + k[i] + w[i]) & 0xFFFFFFFF
+        s0 = (((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^ ((a >> 22) | (a << 10))) & 0xFFFFFFFF
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        h = g
+        g = f
+        f = e
+        e = (d + t1) & 0xFFFFFFFF
+        d = c
+        c = b
+        b = a
+        a = (t1 + s0 + maj) & 0xFFFFFFFF
+    state[0] = (state[0] + a) & 0xFFFFFFFF
+    state[1] = (state[1] + b) & 0xFFFFFFFF
+    state[2] = (state[2] + c) & 0xFFFFFFFF
+    state[3] = (state[3] + d) & 0xFFFFFFFF
+    state[4] = (state[4] + e) & 0xFFFFFFFF
+    state[5] = (state[5] + f) & 0xFFFFFFFF
+    state[6] = (state[6] + g) & 0xFFFFFFFF
+    state[7] = (state[7] + h) & 0xFFFFFFFF
+
+
+def _mine_range_kernel(midstate, tail_words, start_nonce, count, target_words, iv, k):
+    # Returns the first nonce in [start_nonce, start_nonce + count) whose header
+    # hash is at or below the target, or -1. target_words holds the target as
+    # eight big endian 32-bit words, most significant first.
+    w = np.zeros(64, np.int64)
+    state = np.zeros(8, np.int64)
+    for n in range(count):
+        nonce = start_nonce + n
+        w[0] = tail_words[0]
+        w[1] = tail_words[1]
+        w[2] = tail_words[2]
+        w[3] = ((nonce & 0xFF) << 24) | ((nonce & 0xFF00) << 8) | ((nonce >> 8) & 0xFF00) | (nonce >> 24)
+        w[4] = 0x80000000
+        for i in range(5, 15):
+            w[i] = 0
+        w[15] = 0x280
+        for i in range(8):
+            state[i] = midstate[i]
+        _sha256_compress(state, w, k)
+        for i in range(8):
+            w[i] = state[i]
+            state[i] = iv[i]
+        w[8] = 0x80000000
+        for i in range(9, 15):
+            w[i] = 0
+        w[15] = 0x100
+        _sha256_compress(state, w, k)
+        # The hash is compared as a little endian number, so its most
+        # significant word is the byte-swapped last state word.
+        for i in range(8):
+            x = state[7 - i]
+            x = ((x & 0xFF) << 24) | ((x & 0xFF00) << 8) | ((x >> 8) & 0xFF00) | (x >> 24)
+            if x != target_words[i]:
+                break
+        if x <= target_words[i]:
+            return nonce
+    return -1
+
+
+if njit is not None:
+    _sha256_compress = njit(cache=True, boundscheck=False)(_sha256_compress)
+    _mine_range_numba = njit(cache=True, boundscheck=False, nogil=True)(_mine_range_kernel)
+
+
+def mine_genesis_numba(merkle: bytes, spec: NetworkSpec, windows: Iterable[Window]) -> Optional[Tuple[int, int, str]]:
+    target_words = np.array(struct.unpack(">8I", bits_to_target(spec.bits).to_bytes(32, "big")), np.int64)
+    iv = np.array(SHA256_IV, np.int64)
+    k = np.array(SHA256_K, np.int64)
+    prefix = header_prefix(merkle)
+    midstate = np.array(sha256_midstate(prefix[:64]), np.int64)
+    tail_time = None
+    for n_time, nonce, count in windows:
+        if n_time != tail_time:
+            tail_words = np.array(struct.unpack(">3I", prefix[64:] + struct.pack("<II", n_time, spec.bits)), np.int64)
+            tail_time = n_time
+        found = _mine_range_numba(midstate, tail_words, nonce, count, target_words, iv, k)
+        if found >= 0:
+            header = prefix + struct.pack("<III", n_time, spec.bits, found)
+            return n_time, found, dsha256(header)[::-1].hex()
+    return None
+
+
+def mine_genesis_native(lib: ctypes.CDLL, merkle: bytes, spec: NetworkSpec,
+                        windows: Iterable[Window]) -> Optional[Tuple[int, int, str]]:
+    target = bits_to_target(spec.bits).to_bytes(32, "big")
+    prefix = header_prefix(merkle)
+    midstate = (ctypes.c_uint32 * 8)()
+    lib.orin_sha256_midstate(midstate, prefix[:64])
+    found_nonce = ctypes.c_uint32()
+    found_hash = ctypes.create_string_buffer(32)
+    tail_time = None
+    for n_time, nonce, count in windows:
+        if n_time != tail_time:
+            tail = prefix[64:] + struct.pack("<III", n_time, spec.bits, 0)
+            tail_time = n_time
+        # ctypes drops the GIL for the duration of each foreign call.
+        if lib.orin_mine_range(midstate, tail, nonce, count, target, ctypes.byref(found_nonce), found_hash):
+            return n_time, found_nonce.value, found_hash.raw[::-1].hex()
+    return None
+
+
+def mine_genesis_cuda(merkle: bytes, spec: NetworkSpec, windows: Iterable[Window]) -> Optional[Tuple[int, int, str]]:
+    module = cp.RawModule(code=CUDA_KERNEL_SOURCE)
+    kernel = module.get_function("mine_range")
+
+    def set_constant(name: str, values) -> None:
+        cp.ndarray((len(values),), cp.uint32, module.get_global(name))[...] = cp.asarray(values, dtype=cp.uint32)
+
+    prefix = header_prefix(merkle)
+    set_constant("midstate", sha256_midstate(prefix[:64]).tolist())
+    set_constant("target", struct.unpack(">8I", bits_to_target(spec.bits).to_bytes(32, "big")))
+    # Threads that meet the target atomicMin their offset into found, so each
+    # launch reports the lowest winning nonce of its range.
+    found = cp.empty(1, dtype=cp.uint32)
+    tail_time = None
+    for n_time, nonce, count in windows:
+        if n_time != tail_time:
+            set_constant("tail", struct.unpack(">3I", prefix[64:] + struct.pack("<II", n_time, spec.bits)))
+            tail_time = n_time
+        found.fill(0xFFFFFFFF)
+        blocks = (count + CUDA_BLOCK_SIZE - 1) // CUDA_BLOCK_SIZE
+        kernel((blocks,), (CUDA_BLOCK_SIZE,), (cp.uint32(nonce), cp.uint32(count), found))
+        offset = int(found.get()[0])
+        if offset != 0xFFFFFFFF:
+            header = prefix + struct.pack("<III", n_time, spec.bits, nonce + offset)
+            return n_time, nonce + offset, dsha256(header)[::-1].hex()
+    return None
+
+
+def _worker_windows(tasks, results, stop_event) -> Iterator[Window]:
+    # Hand out windows from the monitor to a backend, and report back each
+    # window the backend finished without a solution.
+    while True:
+        window = tasks.get()
+        if window is None or stop_event.is_set():
+            return
+        yield window
+        results.put(("exhausted", window))
+
+
+def _mine_worker(mine: Callable, args: tuple, tasks, results, stop_event) -> None:
+    try:
+        result = mine(*args, _worker_windows(tasks, results, stop_event))
+    except Exception as e:
+        results.put(("error", repr(e)))
+        return
+    if result is not None:
+        results.put(("found", result))
+
+
+def mine_parallel(mine: Callable, args: tuple, spec: NetworkSpec, chunk_size: int, jobs: int,
+                  use_processes: bool) -> Tuple[int, int, str]:
+    # Workers pull windows from a shared stream in whatever order they become
+    # free, so a slow worker never holds back the rest. The monitor keeps a
+    # couple of windows per worker in flight. A solution is only returned once
+    # every window ahead of it in nonce_chunks order has come back exhausted,
+    # so the result is the same as a single-worker search regardless of how
+    # the workers are scheduled.
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+    if jobs == 1:
+        return mine(*args, nonce_chunks(spec, chunk_size))
+    if use_processes:
+        tasks, results = multiprocessing.Queue(), multiprocessing.Queue()
+        stop_event = multiprocessing.Event()
+        worker_type = multiprocessing.Process
+    else:
+        tasks, results = queue.Queue(), queue.Queue()
+        stop_event = threading.Event()
+        worker_type = threading.Thread
+    workers = [
+        worker_type(target=_mine_worker, args=(mine, args, tasks, results, stop_event), daemon=True)
+        for _ in range(jobs)
+    ]
+    for w in workers:
+        w.start()
+
+    windows = nonce_chunks(spec, chunk_size)
+    outstanding = set()
+    found = None
+    try:
+        while True:
+            if found is None:
+                while len(outstanding) < 2 * jobs:
+                    window = next(windows)
+                    outstanding.add(window)
+                    tasks.put(window)
+            elif not any((n_time, nonce + count) <= found[:2] for n_time, nonce, count in outstanding):
+                return found
+            status, value = results.get()
+            if status == "found":
+                # Each backend reports the lowest solution in its window, so
+                # the best one so far is the lowest (n_time, nonce) seen.
+                if found is None or value[:2] < found[:2]:
+                    found = value
+                continue
+            if status == "error":
+                raise RuntimeError(f"Mining worker failed: {value}")
+            outstanding.discard(value)
+    finally:
+        stop_event.set()
+        for _ in workers:
+            tasks.put(None)
+        for w in workers:
+            w.join()
+
+
+def mine_genesis(merkle: bytes, spec: NetworkSpec, backend: str = "auto", jobs: int = 1) -> Tuple[int, int, str]:
+    # The native and Numba kernels release the GIL while they hash, so threads
+    # are enough for them; the hashlib loop needs separate processes.
+    if backend == "cuda":
+        # A single GPU already runs the whole batch in parallel; --jobs does not apply.
+        if cp is None:
+            raise RuntimeError("The cuda backend requires the cupy package")
+        return mine_parallel(mine_genesis_cuda, (merkle, spec), spec, CUDA_BATCH_SIZE, 1, use_processes=False)
+    if backend in ("auto", "native"):
+        lib = load_native()
+        if lib is not None:
+            return mine_parallel(mine_genesis_native, (lib, merkle, spec), spec, NATIVE_CHUNK_SIZE, jobs,
+                                 use_processes=False)
+        if backend == "native":
+            raise RuntimeError(f"Native scanner not found at {NATIVE_LIBRARY}")
+    if backend in ("auto", "numba"):
+        if njit is not None:
+            return mine_parallel(mine_genesis_numba, (merkle, spec), spec, NATIVE_CHUNK_SIZE, jobs,
+                                 use_processes=False)
+        if backend == "numba":
+            raise RuntimeError("The numba backend requires the numba and numpy packages")
+    return mine_parallel(mine_genesis_python, (merkle, spec), spec, PYTHON_CHUNK_SIZE, jobs, use_processes=True)
+
+
 def parse_network_args(values: Iterable[str]) -> Iterable[NetworkSpec]:
     for item in values:
         parts = item.split(":")
@@ -147,7 +629,22 @@ def main() -> None:
         help="Network spec in the form name:time:bits[:nonce]. "
              "Bits can be specified in hex with 0x prefix. Repeat for multiple networks.",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["auto", "python", "native", "numba", "cuda"],
+        default="auto",
+        help="Nonce search implementation. 'auto' uses the native scanner when built, "
+             "then Numba when installed (default: auto)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of parallel workers pulling nonce windows from a shared queue (default: all cores)",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     if not args.nets:
         args.nets = [
@@ -163,7 +660,7 @@ def main() -> None:
 
     print(f"Merkle root: {merkle[::-1].hex()}")
     for spec in parse_network_args(args.nets):
-        n_time, nonce, block_hash = mine_genesis(merkle, spec)
+        n_time, nonce, block_hash = mine_genesis(merkle, spec, args.backend, args.jobs)
         print(f"[{spec.name}] time={n_time} nonce={nonce} hash={block_hash}")
 
 
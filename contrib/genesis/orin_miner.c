@@ -0,0 +1,467 @@
+// Copyright (c) 2025 The Orin Core developers
+// Distributed under the MIT software license, see the accompanying
+// file COPYING or http://www.opensource.org/licenses/mit-license.php.
+//
+// Optional native nonce scanner for find_genesis.py, loaded through ctypes.
+// Build it next to the script with:
+//
+//   cc -O2 -shared -fPIC -o contrib/genesis/orin_miner.so contrib/genesis/orin_miner.c
+//
+// The SHA-NI path is based on src/crypto/sha256_x86_shani.cpp and the
+// 8-way AVX2 path on src/crypto/sha256_avx2.cpp. Each is only used when
+// orin_miner_init() finds the CPU (and, for AVX2, the OS) supports it.
+
+#include <stdint.h>
+#include <string.h>
+
+#if (defined(__x86_64__) || defined(__i386__)) && (defined(__GNUC__) || defined(__clang__))
+#define ORIN_MINER_X86 1
+#include <cpuid.h>
+#include <immintrin.h>
+#endif
+
+static const uint32_t K[64] = {
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+};
+
+static const uint32_t IV[8] = {
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+};
+
+static uint32_t ReadBE32(const unsigned char* p)
+{
+    return ((uint32_t)p[0] << 24) | ((uint32_t)p[1] << 16) | ((uint32_t)p[2] << 8) | (uint32_t)p[3];
+}
+
+static void WriteBE32(unsigned char* p, uint32_t x)
+{
+    p[0] = x >> 24;
+    p[1] = x >> 16;
+    p[2] = x >> 8;
+    p[3] = x;
+}
+
+static uint32_t Bswap32(uint32_t x)
+{
+    return (x >> 24) | ((x >> 8) & 0xff00) | ((x << 8) & 0xff0000) | (x << 24);
+}
+
+#define ROTR(x, n) (((x) >> (n)) | ((x) << (32 - (n))))
+
+/** Compress one 64-byte block (given as big endian message words) into state s. */
+static void Transform(uint32_t* s, const uint32_t* block)
+{
+    uint32_t w[64];
+    uint32_t a = s[0], b = s[1], c = s[2], d = s[3], e = s[4], f = s[5], g = s[6], h = s[7];
+    int i;
+
+    memcpy(w, block, 16 * sizeof(uint32_t));
+    for (i = 16; i < 64; ++i) {
+        uint32_t s0 = ROTR(w[i - 15], 7) ^ ROTR(w[i - 15], 18) ^ (w[i - 15] >> 3);
+        uint32_t s1 = ROTR(w[i - 2], 17) ^ ROTR(w[i - 2], 19) ^ (w[i - 2] >> 10);
+        w[i] = w[i - 16] + s0 + w[i - 7] + s1;
+    }
+    for (i = 0; i < 64; ++i) {
+        uint32_t t1 = h + (ROTR(e, 6) ^ ROTR(e, 11) ^ ROTR(e, 25)) + ((e & f) ^ (~e & g)) + K[i] + w[i];
+        uint32_t t2 = (ROTR(a, 2) ^ ROTR(a, 13) ^ ROTR(a, 22)) + ((a & b) ^ (a & c) ^ (b & c));
+        h = g;
+        g = f;
+        f = e;
+        e = d + t1;
+        d = c;
+        c = b;
+        b = a;
+        a = t1 + t2;
+    }
+    s[0] += a;
+    s[1] += b;
+    s[2] += c;
+    s[3] += d;
+    s[4] += e;
+    s[5] += f;
+    s[6] += g;
+    s[7] += h;
+}
+
+/** Compare a double-SHA256 digest, read as a little endian number, against a big endian target. */
+static int MeetsTarget(const unsigned char* hash, const unsigned char* target)
+{
+    int i;
+    for (i = 0; i < 32; ++i) {
+        if (hash[31 - i] != target[i]) return hash[31 - i] < target[i];
+    }
+    return 1;
+}
+
+static int MineRangeGeneric(const uint32_t* midstate, const unsigned char* tail, uint32_t start_nonce, uint64_t count,
+                            const unsigned char* target, uint32_t* nonce_out, unsigned char* hash_out)
+{
+    uint32_t block1[16] = {0}, block2[16] = {0}, s[8];
+    unsigned char hash[32];
+    uint64_t n;
+    int i;
+
+    // Second block of the 80-byte header: 16 bytes of tail, padding, 640 bit length.
+    for (i = 0; i < 3; ++i) block1[i] = ReadBE32(tail + 4 * i);
+    block1[4] = 0x80000000;
+    block1[15] = 0x280;
+    // Outer hash of the 32-byte digest: padding, 256 bit length.
+    block2[8] = 0x80000000;
+    block2[15] = 0x100;
+
+    for (n = 0; n < count; ++n) {
+        uint32_t nonce = start_nonce + (uint32_t)n;
+        block1[3] = Bswap32(nonce);
+        memcpy(s, midstate, sizeof(s));
+        Transform(s, block1);
+        memcpy(block2, s, sizeof(s));
+        memcpy(s, IV, sizeof(s));
+        Transform(s, block2);
+        for (i = 0; i < 8; ++i) WriteBE32(hash + 4 * i, s[i]);
+        if (MeetsTarget(hash, target)) {
+            *nonce_out = nonce;
+            memcpy(hash_out, hash, 32);
+            return 1;
+        }
+    }
+    return 0;
+}
+
+#ifdef ORIN_MINER_X86
+
+#define SHANI_TARGET __attribute__((target("sha,sse4.1")))
+#define SHANI_INLINE static inline __attribute__((always_inline, target("sha,sse4.1")))
+
+SHANI_INLINE void QuadRound(__m128i* state0, __m128i* state1, __m128i m, int i)
+{
+    const __m128i msg = _mm_add_epi32(m, _mm_loadu_si128((const __m128i*)(K + 4 * i)));
+    *state1 = _mm_sha256rnds2_epu32(*state1, *state0, msg);
+    *state0 = _mm_sha256rnds2_epu32(*state0, *state1, _mm_shuffle_epi32(msg, 0x0e));
+}
+
+SHANI_INLINE void ShiftMessageA(__m128i* m0, __m128i m1)
+{
+    *m0 = _mm_sha256msg1_epu32(*m0, m1);
+}
+
+SHANI_INLINE void ShiftMessageC(__m128i m0, __m128i m1, __m128i* m2)
+{
+    *m2 = _mm_sha256msg2_epu32(_mm_add_epi32(*m2, _mm_alignr_epi8(m1, m0, 4)), m1);
+}
+
+SHANI_INLINE void ShiftMessageB(__m128i* m0, __m128i m1, __m128i* m2)
+{
+    ShiftMessageC(*m0, m1, m2);
+    ShiftMessageA(m0, m1);
+}
+
+SHANI_INLINE void Shuffle(__m128i* s0, __m128i* s1)
+{
+    const __m128i t1 = _mm_shuffle_epi32(*s0, 0xB1);
+    const __m128i t2 = _mm_shuffle_epi32(*s1, 0x1B);
+    *s0 = _mm_alignr_epi8(t1, t2, 0x08);
+    *s1 = _mm_blend_epi16(t2, t1, 0xF0);
+}
+
+SHANI_INLINE void Unshuffle(__m128i* s0, __m128i* s1)
+{
+    const __m128i t1 = _mm_shuffle_epi32(*s0, 0x1B);
+    const __m128i t2 = _mm_shuffle_epi32(*s1, 0xB1);
+    *s0 = _mm_blend_epi16(t1, t2, 0xF0);
+    *s1 = _mm_alignr_epi8(t2, t1, 0x08);
+}
+
+/** One quad round on both lanes, followed by the message schedule step for that round. */
+#define STEP2(i, ma0, ma1, ma2, mb0, mb1, mb2, SHIFT) \
+    do { \
+        QuadRound(&as0, &as1, *(ma1), i); \
+        QuadRound(&bs0, &bs1, *(mb1), i); \
+        SHIFT(ma0, ma1, ma2); \
+        SHIFT(mb0, mb1, mb2); \
+    } while (0)
+#define SHIFT_NONE(m0, m1, m2) (void)0
+#define SHIFT_A(m0, m1, m2) ShiftMessageA(m0, *(m1))
+#define SHIFT_B(m0, m1, m2) ShiftMessageB(m0, *(m1), m2)
+#define SHIFT_C(m0, m1, m2) ShiftMessageC(*(m0), *(m1), m2)
+
+/**
+ * Compress one message block on two independent lanes (a and b), with
+ * message words given in native order and state in the shuffled
+ * (ABEF/CDGH) layout used by sha256rnds2.
+ */
+SHANI_INLINE void Transform2Way(__m128i* a0, __m128i* a1, __m128i am0, __m128i am1, __m128i am2, __m128i am3,
+                                __m128i* b0, __m128i* b1, __m128i bm0, __m128i bm1, __m128i bm2, __m128i bm3)
+{
+    __m128i as0 = *a0, as1 = *a1, bs0 = *b0, bs1 = *b1;
+
+    STEP2(0, &am3, &am0, &am1, &bm3, &bm0, &bm1, SHIFT_NONE);
+    STEP2(1, &am0, &am1, &am2, &bm0, &bm1, &bm2, SHIFT_A);
+    STEP2(2, &am1, &am2, &am3, &bm1, &bm2, &bm3, SHIFT_A);
+    STEP2(3, &am2, &am3, &am0, &bm2, &bm3, &bm0, SHIFT_B);
+    STEP2(4, &am3, &am0, &am1, &bm3, &bm0, &bm1, SHIFT_B);
+    STEP2(5, &am0, &am1, &am2, &bm0, &bm1, &bm2, SHIFT_B);
+    STEP2(6, &am1, &am2, &am3, &bm1, &bm2, &bm3, SHIFT_B);
+    STEP2(7, &am2, &am3, &am0, &bm2, &bm3, &bm0, SHIFT_B);
+    STEP2(8, &am3, &am0, &am1, &bm3, &bm0, &bm1, SHIFT_B);
+    STEP2(9, &am0, &am1, &am2, &bm0, &bm1, &bm2, SHIFT_B);
+    STEP2(10, &am1, &am2, &am3, &bm1, &bm2, &bm3, SHIFT_B);
+    STEP2(11, &am2, &am3, &am0, &bm2, &bm3, &bm0, SHIFT_B);
+    STEP2(12, &am3, &am0, &am1, &bm3, &bm0, &bm1, SHIFT_B);
+    STEP2(13, &am0, &am1, &am2, &bm0, &bm1, &bm2, SHIFT_C);
+    STEP2(14, &am1, &am2, &am3, &bm1, &bm2, &bm3, SHIFT_C);
+    STEP2(15, &am2, &am3, &am0, &bm2, &bm3, &bm0, SHIFT_NONE);
+
+    *a0 = _mm_add_epi32(as0, *a0);
+    *a1 = _mm_add_epi32(as1, *a1);
+    *b0 = _mm_add_epi32(bs0, *b0);
+    *b1 = _mm_add_epi32(bs1, *b1);
+}
+
+SHANI_INLINE void SaveHash(unsigned char* out, __m128i s0, __m128i s1)
+{
+    const __m128i mask = _mm_setr_epi8(3, 2, 1, 0, 7, 6, 5, 4, 11, 10, 9, 8, 15, 14, 13, 12);
+    _mm_storeu_si128((__m128i*)out, _mm_shuffle_epi8(s0, mask));
+    _mm_storeu_si128((__m128i*)(out + 16), _mm_shuffle_epi8(s1, mask));
+}
+
+static SHANI_TARGET int MineRangeShani(const uint32_t* midstate, const unsigned char* tail, uint32_t start_nonce,
+                                       uint64_t count, const unsigned char* target, uint32_t* nonce_out,
+                                       unsigned char* hash_out)
+{
+    // Constant message words of both padded blocks: 0x80 after the data and
+    // the bit length (640 for the 80-byte header, 256 for the 32-byte digest).
+    const __m128i pad1_m1 = _mm_setr_epi32(0x80000000, 0, 0, 0);
+    const __m128i pad1_m3 = _mm_setr_epi32(0, 0, 0, 0x280);
+    const __m128i pad2_m2 = _mm_setr_epi32(0x80000000, 0, 0, 0);
+    const __m128i pad2_m3 = _mm_setr_epi32(0, 0, 0, 0x100);
+    const __m128i zero = _mm_setzero_si128();
+    __m128i mid0 = _mm_loadu_si128((const __m128i*)midstate);
+    __m128i mid1 = _mm_loadu_si128((const __m128i*)(midstate + 4));
+    __m128i iv0 = _mm_loadu_si128((const __m128i*)IV);
+    __m128i iv1 = _mm_loadu_si128((const __m128i*)(IV + 4));
+    const uint32_t w0 = ReadBE32(tail), w1 = ReadBE32(tail + 4), w2 = ReadBE32(tail + 8);
+    unsigned char hash[64];
+    uint64_t n;
+
+    Shuffle(&mid0, &mid1);
+    Shuffle(&iv0, &iv1);
+
+    for (n = 0; n + 1 < count; n += 2) {
+        const uint32_t nonce = start_nonce + (uint32_t)n;
+        __m128i as0 = mid0, as1 = mid1, bs0 = mid0, bs1 = mid1;
+        __m128i am0, am1, bm0, bm1;
+
+        Transform2Way(&as0, &as1, _mm_setr_epi32(w0, w1, w2, Bswap32(nonce)), pad1_m1, zero, pad1_m3,
+                      &bs0, &bs1, _mm_setr_epi32(w0, w1, w2, Bswap32(nonce + 1)), pad1_m1, zero, pad1_m3);
+
+        Unshuffle(&as0, &as1);
+        Unshuffle(&bs0, &bs1);
+        am0 = as0;
+        am1 = as1;
+        bm0 = bs0;
+        bm1 = bs1;
+        as0 = bs0 = iv0;
+        as1 = bs1 = iv1;
+        Transform2Way(&as0, &as1, am0, am1, pad2_m2, pad2_m3, &bs0, &bs1, bm0, bm1, pad2_m2, pad2_m3);
+
+        Unshuffle(&as0, &as1);
+        Unshuffle(&bs0, &bs1);
+        SaveHash(hash, as0, as1);
+        SaveHash(hash + 32, bs0, bs1);
+        if (MeetsTarget(hash, target)) {
+            *nonce_out = nonce;
+            memcpy(hash_out, hash, 32);
+            return 1;
+        }
+        if (MeetsTarget(hash + 32, target)) {
+            *nonce_out = nonce + 1;
+            memcpy(hash_out, hash + 32, 32);
+            return 1;
+        }
+    }
+    if (n < count) {
+        return MineRangeGeneric(midstate, tail, start_nonce + (uint32_t)n, count - n, target, nonce_out, hash_out);
+    }
+    return 0;
+}
+
+static int HaveShani(void)
+{
+    unsigned int eax, ebx, ecx, edx;
+    if (!__get_cpuid(1, &eax, &ebx, &ecx, &edx) || !(ecx & bit_SSE4_1)) return 0;
+    if (!__get_cpuid_count(7, 0, &eax, &ebx, &ecx, &edx)) return 0;
+    return (ebx >> 29) & 1;
+}
+
+#define AVX2_TARGET __attribute__((target("avx2")))
+#define AVX2_INLINE static inline __attribute__((always_inline, target("avx2")))
+
+AVX2_INLINE __m256i Add8(__m256i x, __m256i y) { return _mm256_add_epi32(x, y); }
+AVX2_INLINE __m256i Xor8(__m256i x, __m256i y, __m256i z) { return _mm256_xor_si256(_mm256_xor_si256(x, y), z); }
+AVX2_INLINE __m256i Rotr8(__m256i x, int n) { return _mm256_or_si256(_mm256_srli_epi32(x, n), _mm256_slli_epi32(x, 32 - n)); }
+
+/**
+ * Compress one message block on eight independent lanes, one per 32-bit
+ * element of each vector. Same layout as Transform_8way in sha256_avx2.cpp,
+ * but the rounds are written as a loop over a rolling 16-word schedule.
+ */
+AVX2_INLINE void Transform8Way(__m256i* s, const __m256i* block)
+{
+    __m256i w[16];
+    __m256i a = s[0], b = s[1], c = s[2], d = s[3], e = s[4], f = s[5], g = s[6], h = s[7];
+    int i;
+
+    memcpy(w, block, sizeof(w));
+    for (i = 0; i < 64; ++i) {
+        __m256i t1, t2;
+        if (i >= 16) {
+            const __m256i x = w[(i - 15) & 15], y = w[(i - 2) & 15];
+            const __m256i s0 = Xor8(Rotr8(x, 7), Rotr8(x, 18), _mm256_srli_epi32(x, 3));
+            const __m256i s1 = Xor8(Rotr8(y, 17), Rotr8(y, 19), _mm256_srli_epi32(y, 10));
+            w[i & 15] = Add8(Add8(w[i & 15], s0), Add8(w[(i - 7) & 15], s1));
+        }
+        t1 = Add8(Add8(h, Xor8(Rotr8(e, 6), Rotr8(e, 11), Rotr8(e, 25))),
+                  Add8(_mm256_xor_si256(g, _mm256_and_si256(e, _mm256_xor_si256(f, g))),
+                       Add8(_mm256_set1_epi32(K[i]), w[i & 15])));
+        t2 = Add8(Xor8(Rotr8(a, 2), Rotr8(a, 13), Rotr8(a, 22)),
+                  _mm256_or_si256(_mm256_and_si256(a, b), _mm256_and_si256(c, _mm256_or_si256(a, b))));
+        h = g;
+        g = f;
+        f = e;
+        e = Add8(d, t1);
+        d = c;
+        c = b;
+        b = a;
+        a = Add8(t1, t2);
+    }
+    s[0] = Add8(s[0], a);
+    s[1] = Add8(s[1], b);
+    s[2] = Add8(s[2], c);
+    s[3] = Add8(s[3], d);
+    s[4] = Add8(s[4], e);
+    s[5] = Add8(s[5], f);
+    s[6] = Add8(s[6], g);
+    s[7] = Add8(s[7], h);
+}
+
+static AVX2_TARGET int MineRangeAvx2(const uint32_t* midstate, const unsigned char* tail, uint32_t start_nonce,
+                                     uint64_t count, const unsigned char* target, uint32_t* nonce_out,
+                                     unsigned char* hash_out)
+{
+    // The most significant word of the hash, read as a little endian number,
+    // is the byte-swapped last state word; most lanes are rejected on it.
+    const uint32_t target_top = ReadBE32(target);
+    const __m256i lane = _mm256_setr_epi32(0, 1, 2, 3, 4, 5, 6, 7);
+    const __m256i bswap = _mm256_setr_epi8(3, 2, 1, 0, 7, 6, 5, 4, 11, 10, 9, 8, 15, 14, 13, 12,
+                                           3, 2, 1, 0, 7, 6, 5, 4, 11, 10, 9, 8, 15, 14, 13, 12);
+    __m256i block1[16], block2[16], mid[8], iv[8], s[8];
+    uint32_t top[8], words[8][8];
+    unsigned char hash[32];
+    uint64_t n;
+    int i, j;
+
+    for (i = 0; i < 16; ++i) block1[i] = block2[i] = _mm256_setzero_si256();
+    for (i = 0; i < 3; ++i) block1[i] = _mm256_set1_epi32(ReadBE32(tail + 4 * i));
+    block1[4] = _mm256_set1_epi32(0x80000000);
+    block1[15] = _mm256_set1_epi32(0x280);
+    block2[8] = _mm256_set1_epi32(0x80000000);
+    block2[15] = _mm256_set1_epi32(0x100);
+    for (i = 0; i < 8; ++i) {
+        mid[i] = _mm256_set1_epi32(midstate[i]);
+        iv[i] = _mm256_set1_epi32(IV[i]);
+    }
+
+    for (n = 0; n + 8 <= count; n += 8) {
+        const uint32_t nonce = start_nonce + (uint32_t)n;
+        block1[3] = _mm256_shuffle_epi8(_mm256_add_epi32(_mm256_set1_epi32(nonce), lane), bswap);
+        memcpy(s, mid, sizeof(s));
+        Transform8Way(s, block1);
+        memcpy(block2, s, sizeof(s));
+        memcpy(s, iv, sizeof(s));
+        Transform8Way(s, block2);
+        _mm256_storeu_si256((__m256i*)top, _mm256_shuffle_epi8(s[7], bswap));
+        for (j = 0; j < 8 && top[j] > target_top; ++j) {}
+        if (j == 8) continue;
+        for (i = 0; i < 8; ++i) _mm256_storeu_si256((__m256i*)words[i], s[i]);
+        // Lanes are checked in nonce order so the lowest winning nonce is reported.
+        for (; j < 8; ++j) {
+            if (top[j] > target_top) continue;
+            for (i = 0; i < 8; ++i) WriteBE32(hash + 4 * i, words[i][j]);
+            if (MeetsTarget(hash, target)) {
+                *nonce_out = nonce + j;
+                memcpy(hash_out, hash, 32);
+                return 1;
+            }
+        }
+    }
+    if (n < count) {
+        return MineRangeGeneric(midstate, tail, start_nonce + (uint32_t)n, count - n, target, nonce_out, hash_out);
+    }
+    return 0;
+}
+
+static int HaveAvx2(void)
+{
+    unsigned int eax, ebx, ecx, edx;
+    // AVX2 needs the OS to save YMM state as well as CPU support.
+    if (!__get_cpuid(1, &eax, &ebx, &ecx, &edx) || !(ecx & bit_OSXSAVE)) return 0;
+    __asm__("xgetbv" : "=a"(eax), "=d"(edx) : "c"(0));
+    if ((eax & 6) != 6) return 0;
+    if (!__get_cpuid_count(7, 0, &eax, &ebx, &ecx, &edx)) return 0;
+    return (ebx >> 5) & 1;
+}
+
+#endif // ORIN_MINER_X86
+
+/** Set once by orin_miner_init() and only read afterwards. */
+static int g_have_shani = 0;
+static int g_have_avx2 = 0;
+
+/**
+ * Detect the CPU features used by orin_mine_range(). Must be called once,
+ * before any thread scans a range.
+ */
+void orin_miner_init(void)
+{
+#ifdef ORIN_MINER_X86
+    g_have_shani = HaveShani();
+    g_have_avx2 = HaveAvx2();
+#endif
+}
+
+/** Compute the SHA-256 state after compressing the first 64 bytes of the header. */
+void orin_sha256_midstate(uint32_t* midstate, const unsigned char* block)
+{
+    uint32_t w[16];
+    int i;
+    for (i = 0; i < 16; ++i) w[i] = ReadBE32(block + 4 * i);
+    memcpy(midstate, IV, sizeof(IV));
+    Transform(midstate, w);
+}
+
+/**
+ * Scan nonces [start_nonce, start_nonce + count) of a header whose first
+ * block compresses to midstate and whose last 16 bytes are tail (the nonce
+ * field of tail is ignored). On success store the nonce and the raw double
+ * SHA256 digest and return 1, otherwise return 0.
+ */
+int orin_mine_range(const uint32_t* midstate, const unsigned char* tail, uint32_t start_nonce, uint64_t count,
+                    const unsigned char* target, uint32_t* nonce_out, unsigned char* hash_out)
+{
+#ifdef ORIN_MINER_X86
+    if (g_have_shani) {
+        return MineRangeShani(midstate, tail, start_nonce, count, target, nonce_out, hash_out);
+    }
+    if (g_have_avx2) {
+        return MineRangeAvx2(midstate, tail, start_nonce, count, target, nonce_out, hash_out);
+    }
+#endif
+    return MineRangeGeneric(midstate, tail, start_nonce, count, target, nonce_out, hash_out);
+}
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 The Orin Core developers
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or http://www.opensource.org/licenses/mit-license.php.
+'''
+Test script for find_genesis.py
+'''
+import unittest
+
+import find_genesis
+from find_genesis import NetworkSpec
+
+TIMESTAMP = b'Orin 13/Nov/2025 Rebooting the chain for privacy-first payments'
+PUBKEY = bytes.fromhex('042b55887b34dfaca197bd9e2e965f56086979daf2ebc2a9c85fa72ba83d34e916e6b5e6c58c82becc828e7bb2a45a005b47f80969bd77094ff826a9000cc72c55')
+
+# Low-difficulty specs for the docstring example coinbase and their expected
+# (n_time, nonce, hash). "wrap" starts near the top of the nonce range, so its
+# solution is only found after n_time has been bumped.
+KNOWN_SOLUTIONS = [
+    (NetworkSpec('regtest', 1417626937, 0x207fffff),
+     (1417626937, 0, '12067b369d964062440a5689184e555fb643468f4534519ba591cb3dacab9558')),
+    (NetworkSpec('hard', 1417626937, 0x1f00ffff),
+     (1417626937, 11833, '000067665b38920165cb3aa802904bef4db731e52bc5157d3fc201e2b31a20bd')),
+    (NetworkSpec('exact', 1417626937, 0x1f00ffff, 11833),
+     (1417626937, 11833, '000067665b38920165cb3aa802904bef4db731e52bc5157d3fc201e2b31a20bd')),
+    (NetworkSpec('wrap', 1417626937, 0x1f00ffff, 0xffffff00),
+     (1417626938, 22217, '0000559d6495fd734ee076132dea8b99f56fcd50450e6aae58896523dd274c5e')),
+]
+
+def available_backends():
+    # (name, mine function, leading arguments, run workers in processes)
+    backends = [('python', find_genesis.mine_genesis_python, (), True)]
+    lib = find_genesis.load_native()
+    if lib is not None:
+        backends.append(('native', find_genesis.mine_genesis_native, (lib,), False))
+    if find_genesis.njit is not None:
+        backends.append(('numba', find_genesis.mine_genesis_numba, (), False))
+    if find_genesis.cp is not None:
+        backends.append(('cuda', find_genesis.mine_genesis_cuda, (), False))
+    return backends
+
+class TestFindGenesis(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        _, cls.merkle = find_genesis.build_coinbase(TIMESTAMP, PUBKEY, 50 * find_genesis.COIN)
+        cls.backends = available_backends()
+
+    def test_merkle_root(self):
+        self.assertEqual(self.merkle[::-1].hex(), '19994691c9930e0517df9bd9a067a320c8a31647fcd0bced20ee8b13f03aae84')
+
+    def test_known_solutions(self):
+        for name, _, _, _ in self.backends:
+            for spec, expected in KNOWN_SOLUTIONS:
+                with self.subTest(backend=name, spec=spec.name):
+                    self.assertEqual(find_genesis.mine_genesis(self.merkle, spec, name, jobs=1), expected)
+
+    def test_parallel_matches_single_job(self):
+        # Small windows put the solution a couple of dozen windows into the
+        # stream, so several workers have windows in flight around it.
+        spec = NetworkSpec('harder', 1417626937, 0x1e7fffff)
+        expected = (1417626937, 84467, '00006ee459235de63b249d1010e84db4678d0dd46c1b423da2895614f476ea34')
+        for name, mine, args, use_processes in self.backends:
+            with self.subTest(backend=name):
+                for jobs in (1, 4):
+                    self.assertEqual(find_genesis.mine_parallel(mine, (*args, self.merkle, spec), spec, 4096, jobs,
+                                                                use_processes), expected)
+
+    def test_jobs_must_be_positive(self):
+        for jobs in (0, -1):
+            with self.assertRaises(ValueError):
+                find_genesis.mine_genesis(self.merkle, KNOWN_SOLUTIONS[0][0], 'python', jobs)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,11 +7,10 @@
 # Check for circular dependencies
 
 import os
-import re
 import subprocess
 import sys
 
-EXPECTED_CIRCULAR_DEPENDENCIES = (
+EXPECTED_CIRCULAR_DEPENDENCIES = frozenset({
     "chainparamsbase -> util/system -> chainparamsbase",
     "node/blockstorage -> validation -> node/blockstorage",
     "policy/fees -> txmempool -> policy/fees",
@@ -77,7 +76,7 @@ EXPECTED_CIRCULAR_DEPENDENCIES = (
     "qt/bitcoingui -> qt/guiutil -> qt/bitcoingui",
     "qt/guiutil -> qt/qvalidatedlineedit -> qt/guiutil",
     "wallet/coinjoin -> wallet/receive -> wallet/coinjoin",
-)
+})
 
 CODE_DIR = "src"
 
@@ -87,22 +86,36 @@ def main():
     exit_code = 0
 
     os.chdir(CODE_DIR)
-    files = subprocess.check_output(
+    # Feed the file list to the analyzer over a pipe rather than argv, so it
+    # is not bounded by the OS argument size limit.
+    git_proc = subprocess.Popen(
         ['git', 'ls-files', '--', '*.h', '*.cpp'],
-        universal_newlines=True,
-    ).splitlines()
-
-    command = [sys.executable, "../contrib/devtools/circular-dependencies.py", *files]
-    dependencies_output = subprocess.run(
-        command,
         stdout=subprocess.PIPE,
+    )
+    dependencies_proc = subprocess.Popen(
+        [sys.executable, "../contrib/devtools/circular-dependencies.py"],
+        stdin=git_proc.stdout,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         universal_newlines=True,
     )
+    git_proc.stdout.close()
 
-    for dependency_str in dependencies_output.stdout.rstrip().split("\n"):
+    for dependency_str in dependencies_proc.stdout:
         circular_dependencies.append(
-            re.sub("^Circular dependency: ", "", dependency_str)
+            dependency_str.rstrip("\n").removeprefix("Circular dependency: ")
         )
+    # A missing or truncated report would look like every expected dependency
+    # had gone away, so fail if either process did. The analyzer exits 1
+    # whenever it reports a cycle and only writes to stderr when it fails.
+    errors = dependencies_proc.stderr.read()
+    if dependencies_proc.wait() not in (0, 1) or errors:
+        print(errors, end="", file=sys.stderr)
+        raise subprocess.CalledProcessError(dependencies_proc.returncode, dependencies_proc.args)
+    if git_proc.wait() != 0:
+        raise subprocess.CalledProcessError(git_proc.returncode, git_proc.args)
+
+    found_dependencies = set(circular_dependencies)
 
     # Check for an unexpected dependencies
     for dependency in circular_dependencies:
@@ -114,8 +127,8 @@ def main():
             )
 
     # Check for missing expected dependencies
-    for expected_dependency in EXPECTED_CIRCULAR_DEPENDENCIES:
-        if expected_dependency not in circular_dependencies:
+    for expected_dependency in sorted(EXPECTED_CIRCULAR_DEPENDENCIES):
+        if expected_dependency not in found_dependencies:
             exit_code = 1
             print(
                 f'Good job! The circular dependency "{expected_dependency}" is no longer present.',